@@ -27,50 +27,81 @@ class ElectricPowerSwitch: # 상위 수준 모듈
 
 ### DIP 준수
 
-from abc import ABC, abstractmethod
+from typing import final
+
+class Flyweight: # 상태 없는 객체는 클래스마다 인스턴스 하나만 만들어 공유
+    __slots__ = ()
+
+    def __new__(cls):
+        # 부모 클래스의 캐시를 물려받지 않도록 자기 네임스페이스에서만 찾는다
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+        return instance
+
+class AbstractMethodError(NotImplementedError): # 하위 클래스가 구현하지 않은 메서드를 호출했을 때
+    def __init__(self, instance):
+        super().__init__(f"abstract method must be implemented by {type(instance).__name__}")
+
+class Switchable: # 추상화 (인터페이스) - 구현하지 않은 메서드는 호출 시 AbstractMethodError
+    __slots__ = () # 하위 클래스도 __slots__ 만으로 인스턴스 구조를 고정할 수 있도록
 
-class Switchable(ABC): # 추상화 (인터페이스)
-    @abstractmethod
     def activate(self):
-        pass
+        raise AbstractMethodError(self)
 
-    @abstractmethod
     def deactivate(self):
-        pass
+        raise AbstractMethodError(self)
+
+@final
+class LightBulb(Flyweight, Switchable): # 하위 수준 모듈 (추상화 구현)
+    __slots__ = () # 상태가 없으므로 인스턴스 __dict__ 를 만들지 않는다
 
-class LightBulb(Switchable): # 하위 수준 모듈 (추상화 구현)
     def activate(self):
         print("LightBulb: Turned ON")
 
     def deactivate(self):
         print("LightBulb: Turned OFF")
 
-class Fan(Switchable): # 또 다른 하위 수준 모듈
+@final
+class Fan(Flyweight, Switchable): # 또 다른 하위 수준 모듈
+    __slots__ = ()
+
     def activate(self):
         print("Fan: Turned ON")
 
     def deactivate(self):
         print("Fan: Turned OFF")
 
+LIGHT_BULB = LightBulb()
+FAN = Fan()
+
 class ElectricPowerSwitch: # 상위 수준 모듈
     def __init__(self, device: Switchable): # 추상화(Switchable)에 의존 (의존성 주입)
         self.device = device
         self.on = False
+        self._actions = (device.deactivate, device.activate) # 바뀐 상태(False/True)로 인덱싱
 
     def press(self):
-        if self.on:
-            self.device.deactivate()
-            self.on = False
-        else:
-            self.device.activate()
-            self.on = True
+        self.on = not self.on
+        self._actions[self.on]()
 
 # 사용 예
-# bulb = LightBulb()
-# fan = Fan()
+# bulb = LIGHT_BULB # LightBulb() 도 같은 인스턴스를 돌려준다
+# fan = FAN
 
 # switch_for_bulb = ElectricPowerSwitch(bulb)
 # switch_for_bulb.press() # LightBulb 켜짐
 
 # switch_for_fan = ElectricPowerSwitch(fan)
-# switch_for_fan.press() # Fan 켜짐
\ No newline at end of file
+# switch_for_fan.press() # Fan 켜짐
+
+# 새 장치는 Switchable 만 구현하면 ElectricPowerSwitch 를 고치지 않고 쓸 수 있다
+# class Motor(Switchable):
+#     def activate(self):
+#         print("Motor: Turned ON")
+#
+#     def deactivate(self):
+#         print("Motor: Turned OFF")
+
+# switch_for_motor = ElectricPowerSwitch(Motor())
+# switch_for_motor.press() # Motor 켜짐
\ No newline at end of file
@@ -1,27 +1,36 @@
-from abc import ABC, abstractmethod
+from typing import Protocol, final, runtime_checkable
 
-# 역할에 따라 인터페이스 분리
-class IMachine(ABC):
-    @abstractmethod
-    def start_machine(self):
-        pass
+# 역할에 따라 인터페이스 분리 (구조적 타이핑 - 상속 없이도 메서드만 있으면 만족)
+@runtime_checkable
+class IMachine(Protocol):
+    __slots__ = ()
 
-    @abstractmethod
-    def stop_machine(self):
-        pass
+    def start_machine(self): ...
 
-class IPrinter(ABC):
-    @abstractmethod
-    def print_document(self, document):
-        pass
+    def stop_machine(self): ...
 
-class IStapler(ABC):
-    @abstractmethod
-    def staple_document(self, document):
-        pass
+@runtime_checkable
+class IPrinter(Protocol):
+    __slots__ = ()
+
+    def print_document(self, document): ...
+
+@runtime_checkable
+class IStapler(Protocol):
+    __slots__ = ()
+
+    def staple_document(self, document): ...
+
+@runtime_checkable
+class IPrintStapleMachine(IMachine, IPrinter, IStapler, Protocol): # 여러 인터페이스를 조합
+    __slots__ = ()
 
 # 클래스들은 필요한 인터페이스만 선택적으로 구현
-class SimplePrinter(IMachine, IPrinter): # 기계 기능과 프린터 기능만 구현
+# Protocol 의 __subclasshook__ 가 메서드 존재 여부로 판단하므로 상속하지 않아도 된다
+@final
+class SimplePrinter: # 기계 기능과 프린터 기능만 구현 (IMachine, IPrinter)
+    __slots__ = () # 상태가 없으므로 인스턴스 __dict__ 를 만들지 않는다
+
     def start_machine(self):
         print("SimplePrinter: ON")
 
@@ -31,7 +40,10 @@ class SimplePrinter(IMachine, IPrinter): # 기계 기능과 프린터 기능만
     def print_document(self, document):
         print(f"SimplePrinter: Printing '{document}'")
 
-class AdvancedPrinterStapler(IMachine, IPrinter, IStapler): # 모든 기능 구현
+@final
+class AdvancedPrinterStapler: # 모든 기능 구현 (IPrintStapleMachine)
+    __slots__ = ()
+
     def start_machine(self):
         print("AdvancedPrinterStapler: ON")
 
@@ -50,7 +62,7 @@ class AdvancedPrinterStapler(IMachine, IPrinter, IStapler): # 모든 기능 구
 #     printer.print_document(doc)
 #     machine_control.stop_machine()
 
-# def advanced_print_and_staple_job(device: (IPrinter, IMachine, IStapler), doc): # 모든 기능 요구
+# def advanced_print_and_staple_job(device: IPrintStapleMachine, doc): # 모든 기능 요구
 #     device.start_machine()
 #     device.print_document(doc)
 #     device.staple_document(doc)
@@ -58,6 +70,8 @@ class AdvancedPrinterStapler(IMachine, IPrinter, IStapler): # 모든 기능 구
 
 
 # my_simple_printer = SimplePrinter()
+# isinstance(my_simple_printer, IPrinter) # True - 상속 없이 구조로 판단
+# isinstance(my_simple_printer, IStapler) # False
 # basic_print_job(my_simple_printer, my_simple_printer, "MySimpleReport.docx")
 
 # my_advanced_device = AdvancedPrinterStapler()
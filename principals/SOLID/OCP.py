@@ -1,17 +1,18 @@
 ### OCP 위반
 class PaymentProcessor:
     def process_payment(self, amount, method):
-        if method == "credit_card":
-            print(f"Processing credit card payment of ${amount}")
-            # 신용카드 처리 로직...
-        elif method == "paypal":
-            print(f"Processing PayPal payment of ${amount}")
-            # 페이팔 처리 로직...
-        elif method == "bank_transfer": # 새로운 결제 방식 추가
-            print(f"Processing bank transfer payment of ${amount}")
-            # 계좌 이체 처리 로직...
-        else:
-            raise ValueError("Unsupported payment method")
+        match method:
+            case "credit_card":
+                print(f"Processing credit card payment of ${amount}")
+                # 신용카드 처리 로직...
+            case "paypal":
+                print(f"Processing PayPal payment of ${amount}")
+                # 페이팔 처리 로직...
+            case "bank_transfer": # 새로운 결제 방식 추가
+                print(f"Processing bank transfer payment of ${amount}")
+                # 계좌 이체 처리 로직...
+            case _:
+                raise ValueError("Unsupported payment method")
 
 # 사용 예
 # processor = PaymentProcessor()
@@ -19,38 +20,104 @@ class PaymentProcessor:
 # processor.process_payment(50, "bank_transfer") # 새로운 방식 추가 시 PaymentProcessor 코드 변경 필요
 
 ### OCP 준수
-from abc import ABC, abstractmethod
+from typing import final
+
+class Flyweight: # 상태 없는 객체는 클래스마다 인스턴스 하나만 만들어 공유
+    __slots__ = ()
+
+    def __new__(cls):
+        # 부모 클래스의 캐시를 물려받지 않도록 자기 네임스페이스에서만 찾는다
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+        return instance
+
+class AbstractMethodError(NotImplementedError): # 하위 클래스가 구현하지 않은 메서드를 호출했을 때
+    def __init__(self, instance):
+        super().__init__(f"abstract method must be implemented by {type(instance).__name__}")
+
+class PaymentStrategy: # 구현하지 않은 메서드는 호출 시 AbstractMethodError
+    __slots__ = () # 하위 클래스도 __slots__ 만으로 인스턴스 구조를 고정할 수 있도록
 
-class PaymentStrategy(ABC):
-    @abstractmethod
     def pay(self, amount):
-        pass
+        raise AbstractMethodError(self)
+
+@final
+class CreditCardPayment(Flyweight, PaymentStrategy):
+    __slots__ = () # 상태가 없으므로 인스턴스 __dict__ 를 만들지 않는다
 
-class CreditCardPayment(PaymentStrategy):
     def pay(self, amount):
         print(f"Processing credit card payment of ${amount}")
         # 신용카드 처리 로직...
 
-class PayPalPayment(PaymentStrategy):
+@final
+class PayPalPayment(Flyweight, PaymentStrategy):
+    __slots__ = ()
+
     def pay(self, amount):
         print(f"Processing PayPal payment of ${amount}")
         # 페이팔 처리 로직...
 
-class BankTransferPayment(PaymentStrategy): # 새로운 결제 방식 추가
+@final
+class BankTransferPayment(Flyweight, PaymentStrategy): # 새로운 결제 방식 추가
+    __slots__ = ()
+
     def pay(self, amount):
         print(f"Processing bank transfer payment of ${amount}")
         # 계좌 이체 처리 로직...
 
+CREDIT_CARD = CreditCardPayment()
+PAYPAL = PayPalPayment()
+BANK_TRANSFER = BankTransferPayment()
+
 class PaymentProcessor:
     def process_payment(self, amount, strategy: PaymentStrategy):
         strategy.pay(amount)
 
+    def process_batch(self, amounts, strategy: PaymentStrategy):
+        pay = strategy.pay # 반복문 안에서 매번 찾지 않도록 바운드 메서드를 꺼내둔다
+        for amount in amounts:
+            pay(amount)
+
+class DefaultStrategyPaymentProcessor(PaymentProcessor): # 기본 전략을 정해두고 반복해서 결제
+    def __init__(self, default_strategy: PaymentStrategy):
+        self.set_strategy(default_strategy)
+
+    def set_strategy(self, strategy: PaymentStrategy):
+        # 같은 전략을 반복해서 쓰므로 바운드 메서드를 미리 꺼내둔다
+        self._pay = strategy.pay
+
+    def pay(self, amount):
+        self._pay(amount)
+
+    def pay_batch(self, amounts):
+        pay = self._pay
+        for amount in amounts:
+            pay(amount)
+
+class OrderContainer: # 의존성 주입 컨테이너 - 처리기는 하나만 만들어 재사용 (싱글턴 스코프)
+    _processor = None
+
+    credit_card = staticmethod(CreditCardPayment) # Flyweight 이므로 항상 같은 인스턴스
+
+    @classmethod
+    def processor(cls) -> PaymentProcessor:
+        # 모든 호출자가 공유하므로 기본 전략 없이 만들고, 전략은 호출마다 넘긴다
+        if cls._processor is None:
+            cls._processor = PaymentProcessor()
+        return cls._processor
+
 # 사용 예
-# credit_card_strategy = CreditCardPayment()
-# paypal_strategy = PayPalPayment()
-# bank_transfer_strategy = BankTransferPayment()
+# credit_card_strategy = CREDIT_CARD # CreditCardPayment() 도 같은 인스턴스를 돌려준다
+# paypal_strategy = PAYPAL
+# bank_transfer_strategy = BANK_TRANSFER
 
-# processor = PaymentProcessor()
+# processor = OrderContainer.processor() # 매번 PaymentProcessor() 를 만들지 않고 공유
 # processor.process_payment(100, credit_card_strategy)
 # processor.process_payment(50, paypal_strategy)
-# processor.process_payment(200, bank_transfer_strategy) # 기존 PaymentProcessor 코드 변경 없이 새 기능 사용
\ No newline at end of file
+# processor.process_payment(200, bank_transfer_strategy) # 기존 PaymentProcessor 코드 변경 없이 새 기능 사용
+
+# 같은 전략을 반복해서 쓸 때
+# processor = DefaultStrategyPaymentProcessor(credit_card_strategy)
+# processor.pay(100)
+# processor.pay_batch([10, 20, 30])
\ No newline at end of file
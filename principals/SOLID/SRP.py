@@ -30,14 +30,43 @@ class UserProfile:
 # profile.save_user_to_database()
 
 ### SRP 준수
+import sys
+from collections import OrderedDict
+from collections.abc import Iterable
+
 class User:
+    __slots__ = ("user_id", "name", "email") # __dict__ 없이 고정된 필드만 저장
+
     def __init__(self, user_id, name, email):
         self.user_id = user_id
         self.name = name
         self.email = email
 
 class UserRepository:
+    _CACHE_SIZE = 4096
+
+    def __init__(self):
+        # 조회 결과를 저장소 인스턴스마다 캐싱 (같은 id 재조회 시 DB 접근 생략)
+        # 가장 오래 쓰지 않은 항목부터 버리는 LRU - 단건/일괄 조회가 함께 채운다
+        self._cache = OrderedDict()
+
+    def _remember(self, user_id, user):
+        cache = self._cache
+        cache[user_id] = user
+        cache.move_to_end(user_id)
+        if len(cache) > self._CACHE_SIZE:
+            cache.popitem(last=False)
+
     def get_user_by_id(self, user_id):
+        cache = self._cache
+        if user_id in cache:
+            cache.move_to_end(user_id)
+            return cache[user_id]
+        user = self._fetch_user_by_id(user_id)
+        self._remember(user_id, user)
+        return user
+
+    def _fetch_user_by_id(self, user_id):
         # 데이터베이스에서 사용자 정보를 조회하는 책임
         print(f"Fetching user {user_id} from database...")
         # 예시 데이터 반환
@@ -47,23 +76,41 @@ class UserRepository:
             ##############################################################
         return None
 
+    def get_users_by_ids(self, ids: list[int]) -> dict[int, User]:
+        # 여러 사용자를 한 번의 쿼리로 조회 (id 마다 DB 를 왕복하지 않음)
+        print(f"Fetching users {ids} from database...")
+        # conn.execute(f"SELECT id, name, email FROM users WHERE id IN ({', '.join('?' * len(ids))})", ids)
+        rows = [(1, "개발구루", "guru@example.com")] # 예시 데이터
+        wanted = set(ids)
+        users = {row[0]: User(*row) for row in rows if row[0] in wanted}
+        for user_id in wanted: # 없는 id 도 None 으로 기록해 캐시가 방금 조회한 결과와 같도록
+            self._remember(user_id, users.get(user_id))
+        return users
+
     def save(self, user: User):
         # 사용자를 데이터베이스에 저장하는 책임
         print(f"Saving user {user.name} ({user.user_id}) to database...")
         # conn.execute("INSERT OR UPDATE users ...")
         print(f"User {user.name} saved.")
+        self._cache.pop(user.user_id, None) # 저장한 사용자의 캐시된 조회 결과는 낡았으므로 버린다
 
 class UserDisplayer:
+    _TEMPLATE = "--- User Profile ---\nID: {}\nName: {}\nEmail: {}\n"
+
     def display(self, user: User):
-        # 사용자 정보를 표시하는 책임
+        # 사용자 정보를 표시하는 책임 (여러 줄을 한 번의 write 로 출력)
         if user:
-            print(f"--- User Profile ---")
-            print(f"ID: {user.user_id}")
-            print(f"Name: {user.name}")
-            print(f"Email: {user.email}")
+            sys.stdout.write(self._TEMPLATE.format(user.user_id, user.name, user.email))
         else:
             print("User not found.")
 
+    def display_many(self, users: Iterable[User]):
+        # 여러 사용자를 모아서 한 번의 write 로 출력
+        template = self._TEMPLATE
+        sys.stdout.write("".join(
+            template.format(user.user_id, user.name, user.email) for user in users
+        ))
+
 # 사용 예
 # user_repo = UserRepository()
 # user_displayer = UserDisplayer()
@@ -74,4 +121,8 @@ class UserDisplayer:
 # new_user = User(2, "주니어개발자", "junior@example.com")
 # user_repo.save(new_user)
 # fetched_new_user = user_repo.get_user_by_id(2)
-# user_displayer.display(fetched_new_user)
\ No newline at end of file
+# user_displayer.display(fetched_new_user)
+
+# 여러 사용자를 한꺼번에 조회하고 출력
+# users = user_repo.get_users_by_ids([1, 2, 3])
+# user_displayer.display_many(users.values())
\ No newline at end of file
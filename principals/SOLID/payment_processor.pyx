@@ -0,0 +1,58 @@
+# cython: language_level=3
+### OCP 준수 - Cython 확장 타입 버전 (OCP.py 와 같은 구조)
+# 빌드: python setup.py build_ext --inplace (또는 cythonize -i payment_processor.pyx)
+# 전략 호출을 파이썬 속성 조회 + PyObject_Call 대신 C 수준 가상 함수(vtable)로 처리한다
+cimport cython
+
+class AbstractMethodError(NotImplementedError): # 하위 클래스가 구현하지 않은 메서드를 호출했을 때
+    def __init__(self, instance):
+        super().__init__(f"abstract method must be implemented by {type(instance).__name__}")
+
+cdef class PaymentStrategy:
+    cdef void pay_c(self, amount) except *:
+        # 파이썬 하위 클래스는 cdef 메서드를 재정의할 수 없으므로 pay 로 위임
+        self.pay(amount)
+
+    def pay(self, amount):
+        raise AbstractMethodError(self)
+
+cdef class CPaymentStrategy(PaymentStrategy): # pay_c 를 직접 구현하는 전략의 베이스
+    def pay(self, amount):
+        self.pay_c(amount)
+
+@cython.final # pay_c 가 직접 호출되어 하위 클래스의 pay 재정의가 무시되므로 상속을 막는다
+cdef class CreditCardPayment(CPaymentStrategy):
+    cdef void pay_c(self, amount) except *:
+        print(f"Processing credit card payment of ${amount}")
+        # 신용카드 처리 로직...
+
+@cython.final
+cdef class PayPalPayment(CPaymentStrategy):
+    cdef void pay_c(self, amount) except *:
+        print(f"Processing PayPal payment of ${amount}")
+        # 페이팔 처리 로직...
+
+@cython.final
+cdef class BankTransferPayment(CPaymentStrategy): # 새로운 결제 방식 추가
+    cdef void pay_c(self, amount) except *:
+        print(f"Processing bank transfer payment of ${amount}")
+        # 계좌 이체 처리 로직...
+
+@cython.freelist(128) # 자주 만들고 버리는 인스턴스의 메모리를 재사용
+cdef class PaymentProcessor:
+    cpdef process_payment(self, amount, PaymentStrategy strategy):
+        if strategy is None: # cdef 메서드 호출은 None 을 검사하지 않으므로 직접 막는다
+            raise TypeError("strategy must not be None")
+        strategy.pay_c(amount)
+
+# 사용 예
+# import pyximport; pyximport.install()  # 또는 setup.py 로 미리 빌드
+# from payment_processor import CreditCardPayment, PaymentProcessor
+# processor = PaymentProcessor()
+# processor.process_payment(100, CreditCardPayment())
+
+# 파이썬으로 새 결제 방식 추가 (PaymentProcessor 변경 없음)
+# class GiftCardPayment(PaymentStrategy):
+#     def pay(self, amount):
+#         print(f"Processing gift card payment of ${amount}")
+# processor.process_payment(30, GiftCardPayment())
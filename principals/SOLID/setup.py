@@ -0,0 +1,5 @@
+# payment_processor.pyx 빌드: python setup.py build_ext --inplace
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(ext_modules=cythonize("payment_processor.pyx", language_level=3))